@@ -2,6 +2,7 @@ import { useEffect, useState } from 'react';
 import { GeoJSON, LayerGroup } from 'react-leaflet';
 import { useMapStore } from '@/stores/mapStore';
 import { GIS_LAYERS } from '@/data/gisLayerConfig';
+import { VectorTileLayer } from './VectorTileLayer';
 import type { Layer } from 'leaflet';
 
 interface GeoJSONData {
@@ -22,6 +23,8 @@ export function GISLayers() {
       const data: GeoJSONData = {};
 
       for (const layer of GIS_LAYERS) {
+        // Tiled layers are fetched tile by tile while visible
+        if (layer.tiles) continue;
         try {
           const res = await fetch(`/api/gis/${layer.id}`);
           if (!res.ok) {
@@ -49,6 +52,10 @@ export function GISLayers() {
   return (
     <>
       {GIS_LAYERS.map((layer) => {
+        if (layer.tiles) {
+          return layerVisibility[layer.id] ? <VectorTileLayer key={layer.id} layer={layer} /> : null;
+        }
+
         const data = geoData[layer.id];
         if (!data || !layerVisibility[layer.id]) return null;
 
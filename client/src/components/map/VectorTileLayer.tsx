@@ -0,0 +1,163 @@
+import { useEffect } from 'react';
+import { useMap } from 'react-leaflet';
+import L from 'leaflet';
+import { decodeTile } from '@/lib/mvt';
+import type { TileFeature, TileLayer } from '@/lib/mvt';
+import type { LayerConfig } from '@/data/gisLayerConfig';
+
+const PICK_TOLERANCE_PX = 4; // how close the pointer must come to a line
+
+// Even-odd point-in-polygon over all of a feature's rings, as they are filled
+function insideRings(rings: [number, number][][], x: number, y: number): boolean {
+  let inside = false;
+  for (const ring of rings) {
+    for (let i = 0, j = ring.length - 1; i < ring.length; j = i++) {
+      const [xi, yi] = ring[i];
+      const [xj, yj] = ring[j];
+      if (yi > y !== yj > y && x < ((xj - xi) * (y - yi)) / (yj - yi) + xi) inside = !inside;
+    }
+  }
+  return inside;
+}
+
+function nearLines(lines: [number, number][][], x: number, y: number, tolerance: number): boolean {
+  for (const line of lines) {
+    for (let i = 1; i < line.length; i++) {
+      const [ax, ay] = line[i - 1];
+      const [bx, by] = line[i];
+      const dx = bx - ax;
+      const dy = by - ay;
+      const len2 = dx * dx + dy * dy;
+      const t = len2 ? Math.max(0, Math.min(1, ((x - ax) * dx + (y - ay) * dy) / len2)) : 0;
+      if (Math.hypot(x - (ax + t * dx), y - (ay + t * dy)) <= tolerance) return true;
+    }
+  }
+  return false;
+}
+
+// Draws one /api/gis/tiles/{layer} tile per canvas, and shows the layer's
+// tooltip for the feature under the pointer, picked from the decoded tiles
+class CanvasTileLayer extends L.GridLayer {
+  private decoded = new Map<string, TileLayer>(); // by z/x/y, while the tile is loaded
+  private tooltip = L.tooltip({ sticky: true });
+
+  constructor(private config: LayerConfig, options: L.GridLayerOptions) {
+    super(options);
+    this.on('tileunload', (e: L.TileEvent) => this.decoded.delete(tileKey(e.coords)));
+  }
+
+  onAdd(map: L.Map): this {
+    super.onAdd(map);
+    map.on('mousemove click', this.pick, this);
+    return this;
+  }
+
+  onRemove(map: L.Map): this {
+    map.off('mousemove click', this.pick, this);
+    map.closeTooltip(this.tooltip);
+    this.decoded.clear();
+    return super.onRemove(map);
+  }
+
+  private pick(e: L.LeafletMouseEvent) {
+    const feature = this.featureAt(e.latlng);
+    if (!feature) {
+      this._map.closeTooltip(this.tooltip);
+      return;
+    }
+    const props = Object.fromEntries(Object.entries(feature.properties).map(([k, v]) => [k, String(v)]));
+    this.tooltip.setLatLng(e.latlng).setContent(this.config.tooltipFn(props));
+    this._map.openTooltip(this.tooltip);
+  }
+
+  // The topmost feature under latlng in the tile drawn there, if any
+  private featureAt(latlng: L.LatLng): TileFeature | null {
+    const zoom = this._map.getZoom();
+    const { minZoom = 0, maxNativeZoom = zoom } = this.options;
+    if (zoom < minZoom) return null;
+    const z = Math.min(Math.round(zoom), maxNativeZoom);
+    const size = this.getTileSize();
+    const point = this._map.project(latlng, z);
+    const coords = { x: Math.floor(point.x / size.x), y: Math.floor(point.y / size.y), z };
+    const data = this.decoded.get(tileKey(coords));
+    if (!data) return null;
+
+    const x = ((point.x - coords.x * size.x) / size.x) * data.extent;
+    const y = ((point.y - coords.y * size.y) / size.y) * data.extent;
+    // Tiles past maxNativeZoom are drawn scaled up
+    const tolerance = (PICK_TOLERANCE_PX / size.x / 2 ** (zoom - z)) * data.extent;
+    for (let i = data.features.length - 1; i >= 0; i--) {
+      const feature = data.features[i];
+      if (feature.type === 3 ? insideRings(feature.rings, x, y) : nearLines(feature.rings, x, y, tolerance)) {
+        return feature;
+      }
+    }
+    return null;
+  }
+
+  createTile(coords: L.Coords, done: L.DoneCallback): HTMLElement {
+    const tile = L.DomUtil.create('canvas', 'leaflet-tile') as HTMLCanvasElement;
+    const size = this.getTileSize();
+    const ratio = window.devicePixelRatio || 1;
+    tile.width = size.x * ratio;
+    tile.height = size.y * ratio;
+
+    const { id, style } = this.config;
+    fetch(`/api/gis/tiles/${id}/${coords.z}/${coords.x}/${coords.y}.pbf`)
+      .then((res) => (res.status === 200 ? res.arrayBuffer() : null))
+      .then((buf) => {
+        const data = buf ? decodeTile(buf)[id] : undefined;
+        if (data) this.decoded.set(tileKey(coords), data);
+        const ctx = tile.getContext('2d');
+        if (data && ctx) {
+          const scale = tile.width / data.extent;
+          ctx.lineWidth = (style.weight ?? 1) * ratio;
+          ctx.strokeStyle = style.color ?? '#444';
+          ctx.globalAlpha = style.opacity ?? 1;
+          for (const feature of data.features) {
+            ctx.beginPath();
+            for (const ring of feature.rings) {
+              ring.forEach(([x, y], i) => (i === 0 ? ctx.moveTo(x * scale, y * scale) : ctx.lineTo(x * scale, y * scale)));
+            }
+            if (feature.type === 3 && style.fillOpacity) {
+              ctx.save();
+              ctx.globalAlpha = style.fillOpacity;
+              ctx.fillStyle = style.fillColor ?? style.color ?? '#444';
+              ctx.fill('evenodd');
+              ctx.restore();
+            }
+            ctx.stroke();
+          }
+        }
+        done(undefined, tile);
+      })
+      .catch((err) => done(err, tile));
+
+    return tile;
+  }
+}
+
+function tileKey({ x, y, z }: { x: number; y: number; z: number }): string {
+  return `${z}/${x}/${y}`;
+}
+
+// Renders a layer from its vector tile pyramid so only the tiles in view are
+// downloaded. Used for layers too large to ship as a single GeoJSON.
+export function VectorTileLayer({ layer }: { layer: LayerConfig }) {
+  const map = useMap();
+
+  useEffect(() => {
+    if (!layer.tiles) return;
+    const gridLayer = new CanvasTileLayer(layer, {
+      minZoom: layer.tiles.minZoom,
+      maxNativeZoom: layer.tiles.maxZoom,
+      maxZoom: 22,
+    });
+    gridLayer.addTo(map);
+    return () => {
+      gridLayer.remove();
+    };
+  }, [map, layer]);
+
+  return null;
+}
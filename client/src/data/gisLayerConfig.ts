@@ -9,6 +9,9 @@ export interface LayerConfig {
   defaultVisible: boolean;
   style: PathOptions;
   tooltipFn: (properties: Record<string, string>) => string;
+  /** Drawn from the /api/gis/tiles vector tile pyramid instead of one GeoJSON download.
+   *  Zoom range must match TILE_LAYERS in scripts/build_tiles.py. */
+  tiles?: { minZoom: number; maxZoom: number };
 }
 
 export interface LayerCategory {
@@ -207,6 +210,7 @@ export const GIS_LAYERS: LayerConfig[] = [
     defaultVisible: false,
     style: { color: '#92400e', weight: 0.5, fillColor: '#fbbf24', fillOpacity: 0.25 },
     tooltipFn: () => 'Building',
+    tiles: { minZoom: 14, maxZoom: 16 },
   },
   {
     id: 'parcels',
@@ -217,10 +221,11 @@ export const GIS_LAYERS: LayerConfig[] = [
     defaultVisible: false,
     style: { color: '#444', weight: 0.5, fillOpacity: 0 },
     tooltipFn: (p) => p.PropertyAddress || `Parcel: ${p.PARCELNO || 'N/A'}`,
+    tiles: { minZoom: 13, maxZoom: 16 },
   },
 ];
 
-/** Map of GeoJSON filename per layer ID */
+/** Map of GeoJSON filename per layer ID (building_footprints is tiles only) */
 export const GIS_FILENAMES: Record<string, string> = {
   wetlands: 'wetlands.geojson',
   streams: 'streams.geojson',
@@ -236,7 +241,6 @@ export const GIS_FILENAMES: Record<string, string> = {
   vacant_land: 'vacant_land.geojson',
   zoning: 'zoning.geojson',
   future_land_use: 'future_land_use.geojson',
-  building_footprints: 'building_footprints.geojson',
   sanitary_sewer: 'sanitary_sewer.geojson',
   env_corridors: 'env_corridors.geojson',
 };
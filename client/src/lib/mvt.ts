@@ -0,0 +1,192 @@
+// Minimal Mapbox Vector Tile (v2) decoder for the tiles written by
+// scripts/build_tiles.py. Geometry stays in tile units (0..extent).
+
+export type TileValue = string | number | boolean;
+
+export interface TileFeature {
+  id: number;
+  type: 1 | 2 | 3; // point, linestring, polygon
+  properties: Record<string, TileValue>;
+  rings: [number, number][][];
+}
+
+export interface TileLayer {
+  name: string;
+  extent: number;
+  features: TileFeature[];
+}
+
+class Reader {
+  pos: number;
+  private view: DataView;
+
+  constructor(private buf: Uint8Array, start = 0, public end = buf.length) {
+    this.pos = start;
+    this.view = new DataView(buf.buffer, buf.byteOffset, buf.byteLength);
+  }
+
+  varint(): number {
+    let result = 0;
+    let shift = 1;
+    let byte: number;
+    do {
+      byte = this.buf[this.pos++];
+      result += (byte & 0x7f) * shift;
+      shift *= 128;
+    } while (byte & 0x80);
+    return result;
+  }
+
+  sint(): number {
+    const n = this.varint();
+    return n % 2 === 1 ? -(n + 1) / 2 : n / 2;
+  }
+
+  sub(): Reader {
+    const len = this.varint();
+    const r = new Reader(this.buf, this.pos, this.pos + len);
+    this.pos += len;
+    return r;
+  }
+
+  string(): string {
+    const r = this.sub();
+    return new TextDecoder().decode(this.buf.subarray(r.pos, r.end));
+  }
+
+  packed(): number[] {
+    const r = this.sub();
+    const out: number[] = [];
+    while (r.pos < r.end) out.push(r.varint());
+    return out;
+  }
+
+  double(): number {
+    const v = this.view.getFloat64(this.pos, true);
+    this.pos += 8;
+    return v;
+  }
+
+  float(): number {
+    const v = this.view.getFloat32(this.pos, true);
+    this.pos += 4;
+    return v;
+  }
+
+  skip(wireType: number) {
+    if (wireType === 0) this.varint();
+    else if (wireType === 1) this.pos += 8;
+    else if (wireType === 2) this.pos = this.sub().end;
+    else if (wireType === 5) this.pos += 4;
+    else throw new Error(`Unsupported wire type ${wireType}`);
+  }
+}
+
+function readValue(r: Reader): TileValue {
+  let value: TileValue = '';
+  while (r.pos < r.end) {
+    const tag = r.varint();
+    switch (tag >> 3) {
+      case 1: value = r.string(); break;
+      case 2: value = r.float(); break;
+      case 3: value = r.double(); break;
+      case 4: value = r.varint(); break; // int64 (non-negative in practice)
+      case 5: value = r.varint(); break;
+      case 6: value = r.sint(); break;
+      case 7: value = r.varint() !== 0; break;
+      default: r.skip(tag & 7);
+    }
+  }
+  return value;
+}
+
+function decodeGeometry(cmds: number[]): [number, number][][] {
+  const rings: [number, number][][] = [];
+  let ring: [number, number][] = [];
+  let x = 0;
+  let y = 0;
+  let i = 0;
+  while (i < cmds.length) {
+    const cmd = cmds[i] & 7;
+    const count = cmds[i] >> 3;
+    i++;
+    if (cmd === 7) {
+      if (ring.length) ring.push(ring[0]);
+      continue;
+    }
+    for (let n = 0; n < count; n++) {
+      const dx = cmds[i++];
+      const dy = cmds[i++];
+      x += dx % 2 === 1 ? -(dx + 1) / 2 : dx / 2;
+      y += dy % 2 === 1 ? -(dy + 1) / 2 : dy / 2;
+      if (cmd === 1) {
+        if (ring.length) rings.push(ring);
+        ring = [];
+      }
+      ring.push([x, y]);
+    }
+  }
+  if (ring.length) rings.push(ring);
+  return rings;
+}
+
+function readLayer(r: Reader): TileLayer {
+  let name = '';
+  let extent = 4096;
+  const keys: string[] = [];
+  const values: TileValue[] = [];
+  const raw: { id: number; type: number; tags: number[]; geometry: number[] }[] = [];
+
+  while (r.pos < r.end) {
+    const tag = r.varint();
+    switch (tag >> 3) {
+      case 1: name = r.string(); break;
+      case 2: {
+        const f = r.sub();
+        const feature = { id: 0, type: 0, tags: [] as number[], geometry: [] as number[] };
+        while (f.pos < f.end) {
+          const ftag = f.varint();
+          switch (ftag >> 3) {
+            case 1: feature.id = f.varint(); break;
+            case 2: feature.tags = f.packed(); break;
+            case 3: feature.type = f.varint(); break;
+            case 4: feature.geometry = f.packed(); break;
+            default: f.skip(ftag & 7);
+          }
+        }
+        raw.push(feature);
+        break;
+      }
+      case 3: keys.push(r.string()); break;
+      case 4: values.push(readValue(r.sub())); break;
+      case 5: extent = r.varint(); break;
+      default: r.skip(tag & 7);
+    }
+  }
+
+  // Keys/values follow the features on the wire, so resolve tags afterwards
+  const features = raw.map((f): TileFeature => {
+    const properties: Record<string, TileValue> = {};
+    for (let i = 0; i + 1 < f.tags.length; i += 2) {
+      properties[keys[f.tags[i]]] = values[f.tags[i + 1]];
+    }
+    return { id: f.id, type: f.type as TileFeature['type'], properties, rings: decodeGeometry(f.geometry) };
+  });
+
+  return { name, extent, features };
+}
+
+export function decodeTile(data: ArrayBuffer): Record<string, TileLayer> {
+  const r = new Reader(new Uint8Array(data));
+  const layers: Record<string, TileLayer> = {};
+  while (r.pos < r.end) {
+    const tag = r.varint();
+    if (tag >> 3 === 3) {
+      const layer = readLayer(r.sub());
+      layers[layer.name] = layer;
+    } else {
+      r.skip(tag & 7);
+    }
+  }
+  return layers;
+}